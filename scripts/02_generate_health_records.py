@@ -308,7 +308,7 @@ def extract_health_record(fhir_file: str) -> Dict[str, Any] | None:
                 record['age']
             )
             record['semantic_tree'] = semantic_tree.to_dict()
-            logger.debug(f"Built semantic tree for patient {record['patient_id']}")
+            logger.debug("Built semantic tree for patient %s", record['patient_id'])
         except Exception as e:
             logger.warning(f"Failed to build semantic tree for {record['patient_id']}: {e}")
             record['semantic_tree'] = None
@@ -48,7 +48,7 @@ except ImportError:
     sys.exit(1)
 
 # Import common loaders and semantic matching utilities
-from utils.common_loaders import load_config, load_personas, load_health_records
+from utils.common_loaders import load_config, load_all
 from utils.semantic_matcher import calculate_semantic_matching_score, generate_semantic_alignment_report
 
 # Create logs directory if it doesn't exist
@@ -768,8 +768,7 @@ def main():
     config = load_config(args.config)
 
     # Load data
-    personas = load_personas(args.personas)
-    records = load_health_records(args.records)
+    personas, records, _ = load_all(args.personas, args.records)
 
     logger.info(f"Loaded {len(personas)} personas and {len(records)} health records")
 
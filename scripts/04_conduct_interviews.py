@@ -563,7 +563,7 @@ def conduct_interview(
     for i, question in enumerate(questions[:max_turns]):
         question_text = question.get('text', '')
 
-        logger.debug(f"Question {i+1}/{len(questions)}: {question_text[:50]}...")
+        logger.debug("Question %d/%d: %.50s...", i + 1, len(questions), question_text)
 
         messages.append({'role': 'user', 'content': question_text})
         transcript.append({'speaker': 'Interviewer', 'text': question_text, 'timestamp': dt.now().isoformat()})
@@ -662,7 +662,7 @@ def save_interview(interview: Dict[str, Any], output_dir: str, interview_num: in
     with open(output_file, 'w') as f:
         json.dump(interview, f, indent=2)
 
-    logger.debug(f"Saved interview to {output_file}")
+    logger.debug("Saved interview to %s", output_file)
 
 
 def main():
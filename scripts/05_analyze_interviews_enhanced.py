@@ -42,6 +42,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from utils.common_loaders import load_json_files
+
 # Import NLP modules
 try:
     from scripts.nlp_modules import (
@@ -94,11 +96,9 @@ def load_interviews(limit: Optional[int] = None) -> List[Dict[str, Any]]:
 
     logger.info(f"Loading {len(interview_files)} interviews...")
 
-    for interview_file in interview_files:
+    for interview_file, read in zip(interview_files, load_json_files(interview_files)):
         try:
-            with open(interview_file, 'r') as f:
-                interview_data = json.load(f)
-                interviews.append(interview_data)
+            interviews.append(read.result())
         except Exception as e:
             logger.error(f"Error loading {interview_file.name}: {e}")
 
@@ -28,6 +28,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter
 import argparse
 
+from utils.common_loaders import load_json_files
+
 # NLP imports with fallback handling
 try:
     import nltk
@@ -203,7 +205,7 @@ def tokenize_and_lemmatize(text: str) -> List[str]:
                      if token.isalnum()]  # Filter out punctuation
         return lemmatized
     except Exception as e:
-        logger.debug(f"Lemmatization failed: {e}, using simple split")
+        logger.debug("Lemmatization failed: %s, using simple split", e)
         return [word.lower() for word in text.split()]
 
 
@@ -226,7 +228,7 @@ def analyze_sentiment(text: str) -> Dict[str, float]:
             'compound': scores['compound']
         }
     except Exception as e:
-        logger.debug(f"Sentiment analysis failed: {e}")
+        logger.debug("Sentiment analysis failed: %s", e)
         return {'positive': 0.0, 'negative': 0.0, 'neutral': 1.0, 'compound': 0.0}
 
 
@@ -458,10 +460,9 @@ def load_interviews(interview_dir: str = "data/interviews") -> Tuple[List[Dict[s
 
     logger.info(f"Found {len(interview_files)} interview files to process")
 
-    for file in interview_files:
+    for file, read in zip(interview_files, load_json_files(interview_files)):
         try:
-            with open(file, 'r') as f:
-                data = json.load(f)
+            data = read.result()
         except json.JSONDecodeError as e:
             error_msg = f"Malformed JSON in {file.name}: {e}"
             logger.warning(f"⚠️  Skipping: {error_msg}")
@@ -24,11 +24,24 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
 
+from utils.cost_monitor import history_files_for, load_cost_history
+
 
 def load_cost_data(cost_file: str) -> Dict[str, Any]:
-    """Load cost monitoring data from JSON file."""
+    """
+    Load cost monitoring data from JSON file.
+
+    Cost events live in per-model JSON Lines logs next to the summary file;
+    they are merged in as 'cost_history'. Older summaries that still embed the
+    history are used as-is.
+    """
     with open(cost_file, 'r') as f:
-        return json.load(f)
+        data = json.load(f)
+
+    if history_files_for(cost_file):
+        data['cost_history'] = load_cost_history(cost_file)
+
+    return data
 
 
 def extract_model_provider(model_name: str) -> str:
@@ -53,6 +66,8 @@ def generate_html_dashboard(data: Dict[str, Any], output_file: str):
     model_costs = data.get('model_costs', {})
     model_tokens = data.get('model_tokens', {})
     cost_history = data.get('cost_history', [])
+    # Events rotated out of the history logs still count as calls
+    api_calls = len(cost_history) + sum(data.get('history_events_dropped', {}).values())
     total_cost_usd = data.get('total_cost_usd', 0)
     total_cost_eur = data.get('total_cost_eur', 0)
     total_input_tokens = data.get('total_input_tokens', 0)
@@ -254,7 +269,7 @@ def generate_html_dashboard(data: Dict[str, Any], output_file: str):
 
             <div class="stat-card">
                 <div class="stat-label">API Calls</div>
-                <div class="stat-value">{len(cost_history):,}</div>
+                <div class="stat-value">{api_calls:,}</div>
                 <div class="stat-sublabel">Total requests</div>
             </div>
         </div>
@@ -519,7 +534,7 @@ def generate_html_dashboard(data: Dict[str, Any], output_file: str):
     print(f"📊 Total Cost: €{total_cost_eur:.4f} (${total_cost_usd:.4f} USD)")
     print(f"🔢 Total Tokens: {total_tokens:,}")
     print(f"📈 Models: {len(model_costs)}")
-    print(f"📞 API Calls: {len(cost_history):,}")
+    print(f"📞 API Calls: {api_calls:,}")
 
 
 def main():
@@ -25,11 +25,26 @@ Structure:
 import os
 import json
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 
+def _atomic_write_json(path: Path, data: Any):
+    """
+    Write JSON to a sibling temp file and swap it into place.
+
+    Readers never observe a half-written file, and no fsync is issued since
+    archive metadata is not crash-critical.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+
 class ArchiveManager:
     """Manages workflow run archiving."""
 
@@ -65,25 +80,31 @@ class ArchiveManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.run_id = f"run_{timestamp}"
         self.run_dir = self.base_dir / self.run_id
-        self.run_config = config.copy()
-        self.run_config['run_id'] = self.run_id
-        self.run_config['start_time'] = datetime.now().isoformat()
-
-        # Create directory structure
-        subdirs = [
-            "data/personas",
-            "data/health_records",
-            "data/matched",
-            "data/interviews",
-            "data/analysis",
-            "data/validation",
-            "outputs",
-            "logs",
-            "config"
+        self.run_config = {
+            **config,
+            'run_id': self.run_id,
+            'start_time': datetime.now().isoformat()
+        }
+
+        # Create directory structure; only the first mkdir needs to walk
+        # parents, the rest are direct children of directories created here
+        data_dir = self.run_dir / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        for subdir in ["outputs", "logs", "config"]:
+            (self.run_dir / subdir).mkdir(exist_ok=True)
+
+        data_subdirs = [
+            "personas",
+            "health_records",
+            "matched",
+            "interviews",
+            "analysis",
+            "validation"
         ]
 
-        for subdir in subdirs:
-            (self.run_dir / subdir).mkdir(parents=True, exist_ok=True)
+        for subdir in data_subdirs:
+            (data_dir / subdir).mkdir(exist_ok=True)
 
         # Save initial config
         config_file = self.run_dir / "config" / "run_config.json"
@@ -125,9 +146,10 @@ class ArchiveManager:
         if 'stages' not in self.run_results:
             self.run_results['stages'] = {}
 
+        # Keep the raw clock reading; it is rendered to ISO format once in finalize_run
         self.run_results['stages'][stage_name] = {
             **result,
-            'timestamp': datetime.now().isoformat()
+            'ts_ns': time.time_ns()
         }
 
     def finalize_run(self, success: bool, total_time: float,
@@ -156,6 +178,10 @@ class ArchiveManager:
 
         # Calculate summary statistics
         stages = self.run_results.get('stages', {})
+        for stage_info in stages.values():
+            if 'ts_ns' in stage_info:
+                ts_ns = stage_info.pop('ts_ns')
+                stage_info['timestamp'] = datetime.fromtimestamp(ts_ns / 1e9).isoformat()
         successful_stages = sum(1 for s in stages.values() if s.get('success', False))
         total_stages = len(stages)
 
@@ -191,10 +217,21 @@ class ArchiveManager:
 
         return run_summary_file
 
-    def _generate_summary(self) -> str:
-        """Generate markdown summary of the run."""
-        config = self.run_config
-        results = self.run_results
+    def _generate_summary(self, config: Optional[Dict[str, Any]] = None,
+                          results: Optional[Dict[str, Any]] = None,
+                          run_dir: Optional[Path] = None) -> str:
+        """
+        Generate markdown summary of a run.
+
+        Defaults to the current run; pass config/results/run_dir to render a
+        summary for an archived run from its run_results.json.
+        """
+        if config is None:
+            config = self.run_config
+        if results is None:
+            results = self.run_results
+        if run_dir is None:
+            run_dir = self.run_dir
         stages = results.get('stages', {})
         summary = results.get('summary', {})
 
@@ -245,34 +282,35 @@ class ArchiveManager:
 |-------|--------|----------|
 """
         # Add stage results
-        for stage_name, stage_info in stages.items():
-            status = "SUCCESS" if stage_info.get('success') else "FAILED"
-            time_taken = stage_info.get('time', 0)
-            md += f"| {stage_name} | {status} | {time_taken:.2f}s |\n"
+        md += "".join(
+            f"| {stage_name} | {'SUCCESS' if stage_info.get('success') else 'FAILED'} "
+            f"| {stage_info.get('time', 0):.2f}s |\n"
+            for stage_name, stage_info in stages.items()
+        )
 
         # Add output locations
-        if self.run_dir:
+        if run_dir:
             md += f"""
 ## Output Locations
 
-All outputs are stored in: `{self.run_dir}`
+All outputs are stored in: `{run_dir}`
 
 | Data Type | Location |
 |-----------|----------|
-| Personas | `{self.run_dir}/data/personas/` |
-| Health Records | `{self.run_dir}/data/health_records/` |
-| Matched Pairs | `{self.run_dir}/data/matched/` |
-| Interviews | `{self.run_dir}/data/interviews/` |
-| Analysis | `{self.run_dir}/data/analysis/` |
-| Validation | `{self.run_dir}/data/validation/` |
-| Outputs | `{self.run_dir}/outputs/` |
-| Logs | `{self.run_dir}/logs/` |
+| Personas | `{run_dir}/data/personas/` |
+| Health Records | `{run_dir}/data/health_records/` |
+| Matched Pairs | `{run_dir}/data/matched/` |
+| Interviews | `{run_dir}/data/interviews/` |
+| Analysis | `{run_dir}/data/analysis/` |
+| Validation | `{run_dir}/data/validation/` |
+| Outputs | `{run_dir}/outputs/` |
+| Logs | `{run_dir}/logs/` |
 
 ### Key Files
 
-- **Run Configuration**: `{self.run_dir}/config/run_config.json`
-- **Run Results**: `{self.run_dir}/outputs/run_results.json`
-- **This Summary**: `{self.run_dir}/RUN_SUMMARY.md`
+- **Run Configuration**: `{run_dir}/config/run_config.json`
+- **Run Results**: `{run_dir}/outputs/run_results.json`
+- **This Summary**: `{run_dir}/RUN_SUMMARY.md`
 """
 
         # Add timestamp
@@ -283,16 +321,61 @@ All outputs are stored in: `{self.run_dir}`
 
         return md
 
+    def ensure_summary(self, run_id: str) -> Optional[Path]:
+        """
+        Make sure an archived run has an up-to-date RUN_SUMMARY.md.
+
+        The summary is re-rendered from outputs/run_results.json only when it
+        is missing or older than the results file.
+
+        Args:
+            run_id: The run ID to summarise
+
+        Returns:
+            Path to the summary file, or None if the run has no results
+        """
+        run = self.get_run(run_id)
+        run_dir = Path(run['directory']) if run else self.base_dir / run_id
+        results_file = run_dir / "outputs" / "run_results.json"
+        summary_file = run_dir / "RUN_SUMMARY.md"
+
+        if not results_file.exists():
+            return None
+
+        if summary_file.exists() and summary_file.stat().st_mtime >= results_file.stat().st_mtime:
+            return summary_file
+
+        try:
+            with open(results_file, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+
+        summary_content = self._generate_summary(
+            config=data.get('config', {}),
+            results=data.get('results', {}),
+            run_dir=run_dir
+        )
+        with open(summary_file, 'w') as f:
+            f.write(summary_content)
+
+        return summary_file
+
+    def _load_history(self) -> List[Dict[str, Any]]:
+        """Load the run history, returning an empty list if missing or unreadable."""
+        if not self.history_file.exists():
+            return []
+
+        try:
+            with open(self.history_file, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return []
+
     def _update_history(self):
         """Update the run history file."""
         # Load existing history
-        history = []
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, 'r') as f:
-                    history = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                history = []
+        history = self._load_history()
 
         # Add current run
         run_entry = {
@@ -315,8 +398,7 @@ All outputs are stored in: `{self.run_dir}`
         history.append(run_entry)
 
         # Save updated history
-        with open(self.history_file, 'w') as f:
-            json.dump(history, f, indent=2, default=str)
+        _atomic_write_json(self.history_file, history)
 
     def copy_to_archive(self, source_path: str, dest_subdir: str) -> Path:
         """
@@ -359,15 +441,8 @@ All outputs are stored in: `{self.run_dir}`
         Returns:
             List of run entries (most recent first)
         """
-        if not self.history_file.exists():
-            return []
-
-        try:
-            with open(self.history_file, 'r') as f:
-                history = json.load(f)
-            return list(reversed(history))[:limit]
-        except (json.JSONDecodeError, IOError):
-            return []
+        history = self._load_history()
+        return history[::-1][:limit]
 
     def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -379,12 +454,25 @@ All outputs are stored in: `{self.run_dir}`
         Returns:
             Run entry dictionary or None if not found
         """
-        runs = self.list_runs(limit=1000)  # Get all runs
-        for run in runs:
+        # Scan newest-first and stop at the first match instead of
+        # materialising a reversed copy of the whole history
+        for run in reversed(self._load_history()):
             if run.get('run_id') == run_id:
                 return run
         return None
 
+    @staticmethod
+    def _remove_run_dir(run_dir: Path):
+        """Remove a single run directory, reporting but not raising on failure."""
+        if not run_dir.exists():
+            return
+
+        try:
+            shutil.rmtree(run_dir)
+            print(f"Removed old run: {run_dir}")
+        except Exception as e:
+            print(f"Failed to remove {run_dir}: {e}")
+
     def cleanup_old_runs(self, keep_count: int = 10):
         """
         Remove old run directories, keeping only the most recent.
@@ -392,34 +480,21 @@ All outputs are stored in: `{self.run_dir}`
         Args:
             keep_count: Number of recent runs to keep
         """
-        if not self.history_file.exists():
-            return
-
-        try:
-            with open(self.history_file, 'r') as f:
-                history = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return
-
+        history = self._load_history()
         if len(history) <= keep_count:
             return
 
         # Get runs to remove (oldest first)
         runs_to_remove = history[:-keep_count]
+        run_dirs = [Path(run['directory']) for run in runs_to_remove if run.get('directory')]
 
-        for run in runs_to_remove:
-            run_dir = Path(run.get('directory', ''))
-            if run_dir.exists():
-                try:
-                    shutil.rmtree(run_dir)
-                    print(f"Removed old run: {run_dir}")
-                except Exception as e:
-                    print(f"Failed to remove {run_dir}: {e}")
+        # Run directories are independent trees, so remove them concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(run_dirs)))) as executor:
+            list(executor.map(self._remove_run_dir, run_dirs))
 
         # Update history
         history = history[-keep_count:]
-        with open(self.history_file, 'w') as f:
-            json.dump(history, f, indent=2, default=str)
+        _atomic_write_json(self.history_file, history)
 
 
 def get_archive_manager(base_dir: str = "archive") -> ArchiveManager:
@@ -464,6 +539,9 @@ if __name__ == '__main__':
         if run:
             print(f"\nRun Details: {args.info}\n")
             print(json.dumps(run, indent=2, default=str))
+            summary_path = manager.ensure_summary(args.info)
+            if summary_path:
+                print(f"\nSummary: {summary_path}")
         else:
             print(f"Run not found: {args.info}")
 
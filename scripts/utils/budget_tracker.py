@@ -8,10 +8,38 @@ Tracks spending against budgets and warns when approaching limits.
 
 import os
 import json
+import atexit
 from datetime import datetime
 from typing import Dict, Optional, Tuple
 from utils.cost_monitor import CostMonitor, Colors
 
+# Fixed, pre-coloured pieces of the budget panels. Only the numeric values
+# change between renders, so these are built once at import time.
+_GLOBAL_RULE = f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.RESET}"
+_GLOBAL_HEADER = f"\n{_GLOBAL_RULE}\n{Colors.BOLD}{Colors.CYAN}  GLOBAL BUDGET OVERVIEW{Colors.RESET}\n{_GLOBAL_RULE}\n"
+_GLOBAL_FOOTER = f"\n{Colors.CYAN}{'='*70}{Colors.RESET}\n"
+_MODEL_RULE = f"{Colors.BOLD}{Colors.MAGENTA}{'='*70}{Colors.RESET}"
+_MODEL_FOOTER = f"\n{Colors.MAGENTA}{'='*70}{Colors.RESET}\n"
+
+# Every possible global-budget progress bar, indexed by filled cell count
+_BAR_WIDTH = 50
+_PROGRESS_BARS = ['█' * filled + '░' * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1)]
+
+_LBL_TOTAL_BUDGET = f"{Colors.WHITE}Total Budget:{Colors.RESET}"
+_LBL_ALLOCATED = f"{Colors.YELLOW}Allocated:{Colors.RESET}"
+_LBL_SPENT = f"{Colors.RED}Spent:{Colors.RESET}"
+_LBL_REMAINING = f"{Colors.GREEN}Remaining:{Colors.RESET}"
+
+_LBL_INTERVIEWS_PLANNED = f"{Colors.WHITE}Interviews Planned:{Colors.RESET}"
+_LBL_COST_PER_INTERVIEW = f"{Colors.WHITE}Cost per Interview:{Colors.RESET}"
+_LBL_ESTIMATED_TOTAL = f"{Colors.YELLOW}Estimated Total:{Colors.RESET}"
+_LBL_MODEL_BUDGET = f"{Colors.WHITE}Model Budget:{Colors.RESET}"
+_LBL_ALREADY_SPENT = f"{Colors.RED}Already Spent:{Colors.RESET}"
+_LBL_MODEL_REMAINING = f"{Colors.CYAN}Remaining:{Colors.RESET}"
+_LBL_AFTER_BATCH = f"{Colors.GREEN}After This Batch:{Colors.RESET}"
+_LBL_UTILIZATION = f"{Colors.WHITE}Budget Utilization:{Colors.RESET}"
+
+
 class BudgetTracker:
     """Track and manage budgets for Phase 4 testing."""
 
@@ -30,6 +58,7 @@ class BudgetTracker:
         self.model_budgets = {}  # {model: budget_eur}
         self.approved_budgets = set()  # Set of approved model names
         self.cost_monitor = CostMonitor()
+        self._dirty = False  # Unsaved budget changes pending
 
         # Ensure output directory exists
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
@@ -37,6 +66,9 @@ class BudgetTracker:
         # Load existing data if available
         self._load_state()
 
+        # Budget edits are saved lazily; make sure they reach disk on exit
+        atexit.register(self.flush)
+
     def _load_state(self):
         """Load existing budget state from file."""
         if os.path.exists(self.log_file):
@@ -50,29 +82,45 @@ class BudgetTracker:
 
     def _save_state(self):
         """Save budget state to file."""
+        total_spent = self.cost_monitor.get_total_cost(in_eur=True)
         data = {
             'timestamp': datetime.now().isoformat(),
             'global_budget_eur': self.global_budget_eur,
             'model_budgets': self.model_budgets,
             'approved_budgets': list(self.approved_budgets),
             'total_allocated': sum(self.model_budgets.values()),
-            'total_spent': self.cost_monitor.get_total_cost(in_eur=True),
-            'remaining_budget': self.get_remaining_budget()
+            'total_spent': total_spent,
+            'remaining_budget': self.global_budget_eur - total_spent
         }
 
-        with open(self.log_file, 'w') as f:
+        # Write to a temp file and swap it in so a crash mid-write cannot
+        # leave a truncated file that _load_state would silently discard
+        tmp_file = f"{self.log_file}.tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.log_file)
+        self._dirty = False
+
+    def flush(self):
+        """Save budget state if there are unsaved changes."""
+        if self._dirty:
+            self._save_state()
 
     def set_model_budget(self, model: str, budget_eur: float):
         """
         Set budget for a specific model.
 
+        The change is kept in memory and written on the next approval,
+        flush() or interpreter exit.
+
         Args:
             model: Model identifier
             budget_eur: Budget in EUR
         """
         self.model_budgets[model] = budget_eur
-        self._save_state()
+        self._dirty = True
 
     def get_remaining_budget(self) -> float:
         """Get remaining global budget in EUR."""
@@ -87,24 +135,14 @@ class BudgetTracker:
 
     def display_global_budget(self):
         """Display global budget overview."""
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}  GLOBAL BUDGET OVERVIEW{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.RESET}\n")
-
         total_allocated = sum(self.model_budgets.values())
         total_spent = self.cost_monitor.get_total_cost(in_eur=True)
-        remaining = self.get_remaining_budget()
-
-        print(f"{Colors.WHITE}Total Budget:{Colors.RESET}      €{self.global_budget_eur:.2f}")
-        print(f"{Colors.YELLOW}Allocated:{Colors.RESET}        €{total_allocated:.2f} ({total_allocated/self.global_budget_eur*100:.1f}%)")
-        print(f"{Colors.RED}Spent:{Colors.RESET}            €{total_spent:.4f} ({total_spent/self.global_budget_eur*100:.2f}%)")
-        print(f"{Colors.GREEN}Remaining:{Colors.RESET}        €{remaining:.2f} ({remaining/self.global_budget_eur*100:.1f}%)")
+        remaining = self.global_budget_eur - total_spent
 
         # Progress bar
         spent_pct = min(100, total_spent / self.global_budget_eur * 100)
-        bar_width = 50
-        filled = int(bar_width * spent_pct / 100)
-        bar = '█' * filled + '░' * (bar_width - filled)
+        filled = int(_BAR_WIDTH * spent_pct / 100)
+        bar = _PROGRESS_BARS[max(0, filled)]
 
         if spent_pct < 50:
             color = Colors.GREEN
@@ -113,8 +151,16 @@ class BudgetTracker:
         else:
             color = Colors.RED
 
-        print(f"\n{color}{bar}{Colors.RESET} {spent_pct:.2f}%")
-        print(f"\n{Colors.CYAN}{'='*70}{Colors.RESET}\n")
+        # Assemble the whole panel and emit it with a single print
+        print("\n".join([
+            _GLOBAL_HEADER,
+            f"{_LBL_TOTAL_BUDGET}      €{self.global_budget_eur:.2f}",
+            f"{_LBL_ALLOCATED}        €{total_allocated:.2f} ({total_allocated/self.global_budget_eur*100:.1f}%)",
+            f"{_LBL_SPENT}            €{total_spent:.4f} ({total_spent/self.global_budget_eur*100:.2f}%)",
+            f"{_LBL_REMAINING}        €{remaining:.2f} ({remaining/self.global_budget_eur*100:.1f}%)",
+            f"\n{color}{bar}{Colors.RESET} {spent_pct:.2f}%",
+            _GLOBAL_FOOTER
+        ]))
 
     def display_model_budget(self, model: str,
                             interviews_planned: int,
@@ -132,29 +178,31 @@ class BudgetTracker:
         estimated_cost = interviews_planned * cost_per_interview
         remaining_after = budget - spent - estimated_cost
 
-        print(f"\n{Colors.BOLD}{Colors.MAGENTA}{'='*70}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.MAGENTA}  MODEL BUDGET: {model}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.MAGENTA}{'='*70}{Colors.RESET}\n")
-
-        print(f"{Colors.WHITE}Interviews Planned:{Colors.RESET}   {interviews_planned}")
-        print(f"{Colors.WHITE}Cost per Interview:{Colors.RESET}  €{cost_per_interview:.4f}")
-        print(f"{Colors.YELLOW}Estimated Total:{Colors.RESET}      €{estimated_cost:.4f}")
-        print()
-        print(f"{Colors.WHITE}Model Budget:{Colors.RESET}         €{budget:.4f}")
-        print(f"{Colors.RED}Already Spent:{Colors.RESET}       €{spent:.4f}")
-        print(f"{Colors.CYAN}Remaining:{Colors.RESET}           €{(budget - spent):.4f}")
-        print(f"{Colors.GREEN}After This Batch:{Colors.RESET}    €{remaining_after:.4f}")
+        lines = [
+            f"\n{_MODEL_RULE}",
+            f"{Colors.BOLD}{Colors.MAGENTA}  MODEL BUDGET: {model}{Colors.RESET}",
+            f"{_MODEL_RULE}\n",
+            f"{_LBL_INTERVIEWS_PLANNED}   {interviews_planned}",
+            f"{_LBL_COST_PER_INTERVIEW}  €{cost_per_interview:.4f}",
+            f"{_LBL_ESTIMATED_TOTAL}      €{estimated_cost:.4f}",
+            "",
+            f"{_LBL_MODEL_BUDGET}         €{budget:.4f}",
+            f"{_LBL_ALREADY_SPENT}       €{spent:.4f}",
+            f"{_LBL_MODEL_REMAINING}           €{(budget - spent):.4f}",
+            f"{_LBL_AFTER_BATCH}    €{remaining_after:.4f}"
+        ]
 
         # Warning if over budget
         if remaining_after < 0:
-            print(f"\n{Colors.RED}{Colors.BOLD}⚠️  WARNING: This batch exceeds model budget by €{abs(remaining_after):.4f}{Colors.RESET}")
+            lines.append(f"\n{Colors.RED}{Colors.BOLD}⚠️  WARNING: This batch exceeds model budget by €{abs(remaining_after):.4f}{Colors.RESET}")
 
         # Show percentage
         if budget > 0:
             pct_used = (spent + estimated_cost) / budget * 100
-            print(f"\n{Colors.WHITE}Budget Utilization:{Colors.RESET}  {pct_used:.1f}%")
+            lines.append(f"\n{_LBL_UTILIZATION}  {pct_used:.1f}%")
 
-        print(f"\n{Colors.MAGENTA}{'='*70}{Colors.RESET}\n")
+        lines.append(_MODEL_FOOTER)
+        print("\n".join(lines))
 
     def request_approval(self, model: str,
                         interviews_planned: int,
@@ -212,21 +260,22 @@ class BudgetTracker:
 
     def generate_budget_report(self) -> Dict:
         """Generate comprehensive budget report."""
+        total_spent = self.cost_monitor.get_total_cost(in_eur=True)
         report = {
             'timestamp': datetime.now().isoformat(),
             'global_budget': {
                 'total_eur': self.global_budget_eur,
                 'allocated_eur': sum(self.model_budgets.values()),
-                'spent_eur': self.cost_monitor.get_total_cost(in_eur=True),
-                'remaining_eur': self.get_remaining_budget(),
-                'utilization_pct': (self.cost_monitor.get_total_cost(in_eur=True) /
-                                   self.global_budget_eur * 100)
+                'spent_eur': total_spent,
+                'remaining_eur': self.global_budget_eur - total_spent,
+                'utilization_pct': total_spent / self.global_budget_eur * 100
             },
             'model_budgets': {}
         }
 
+        model_costs = self.cost_monitor.get_costs_by_model(in_eur=True)
         for model, budget in self.model_budgets.items():
-            spent = self.cost_monitor.get_model_cost(model, in_eur=True)
+            spent = model_costs.get(model, 0.0)
             report['model_budgets'][model] = {
                 'budget_eur': budget,
                 'spent_eur': spent,
@@ -5,10 +5,14 @@ This module consolidates duplicated data loading functions that were
 previously scattered across multiple scripts.
 """
 
+import copy
 import json
 import logging
+import mmap
+import os
 import sys
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, List, NoReturn, Optional, Tuple
 from pathlib import Path
 
 try:
@@ -18,6 +22,16 @@ except ImportError:
     print("Please run: pip install pyyaml")
     sys.exit(1)
 
+# Optional C-backed JSON parser; the stdlib decoder is used when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Data files at least this large are memory-mapped rather than read into memory
+MMAP_THRESHOLD_BYTES = 16 * 1024 * 1024
+
 # Import custom exceptions
 from utils.exceptions import (
     ConfigurationError,
@@ -25,12 +39,64 @@ from utils.exceptions import (
     InvalidDataFormatError,
     DataValidationError
 )
-from utils.validators import validate_config
+from utils.validators import (
+    validate_config,
+    validate_persona,
+    validate_health_record,
+    validate_matched_pair
+)
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed config files and their validate_config results, keyed by resolved
+# path and stored with the (mtime_ns, size) signature they were computed for
+_config_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_config_validation_cache: Dict[str, Tuple[Tuple[int, int], Tuple[bool, List[str]]]] = {}
+
+
+def _file_signature(file_path: Path) -> Tuple[str, Tuple[int, int]]:
+    """Return (resolved path, (mtime_ns, size)) used to key the config caches."""
+    stat = file_path.stat()
+    return str(file_path.resolve()), (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_cached_yaml(config_file: Path, cache_key: str,
+                      signature: Tuple[int, int]) -> Any:
+    """
+    Parse a YAML file, memoized on its (mtime, size) signature.
+
+    Callers get a deep copy so that mutating a returned config cannot
+    affect later loads of the same file.
+    """
+    cached = _config_cache.get(cache_key)
+
+    if cached is None or cached[0] != signature:
+        # Hand libyaml raw bytes so it skips Python's text decoding layer
+        with open(config_file, 'rb') as f:
+            parsed = yaml.load(f, Loader=_YAML_LOADER)
+        cached = (signature, parsed)
+        _config_cache[cache_key] = cached
+
+    return copy.deepcopy(cached[1])
+
+
+def _validate_config_cached(config: Dict[str, Any], cache_key: str,
+                            signature: Tuple[int, int]) -> Tuple[bool, List[str]]:
+    """Run validate_config, reusing the result for an unchanged file."""
+    cached = _config_validation_cache.get(cache_key)
+
+    if cached is None or cached[0] != signature:
+        cached = (signature, validate_config(config))
+        _config_validation_cache[cache_key] = cached
+
+    return cached[1]
+
+
 def load_config(config_path: str = "config/config.yaml",
                 validate: bool = True,
                 raise_on_error: bool = False) -> Dict[str, Any]:
@@ -63,9 +129,9 @@ def load_config(config_path: str = "config/config.yaml",
                 raise MissingConfigError(error_msg)
             return {}
 
-        # Load YAML
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Load YAML, reusing the previous parse if the file is unchanged
+        cache_key, signature = _file_signature(config_file)
+        config = _load_cached_yaml(config_file, cache_key, signature)
 
         # Validate it's a dictionary
         if not isinstance(config, dict):
@@ -79,7 +145,7 @@ def load_config(config_path: str = "config/config.yaml",
 
         # Validate configuration
         if validate:
-            is_valid, warnings = validate_config(config)
+            is_valid, warnings = _validate_config_cached(config, cache_key, signature)
             if warnings:
                 logger.warning(f"Configuration validation warnings for {config_path}:")
                 for warning in warnings:
@@ -108,91 +174,185 @@ def load_config(config_path: str = "config/config.yaml",
         return {}
 
 
-def load_personas(personas_file: str,
-                  validate: bool = False,
-                  raise_on_error: bool = True) -> List[Dict[str, Any]]:
+def load_json_file(file_path: str) -> Any:
     """
-    Load and optionally validate personas from JSON file.
+    Parse a JSON data file.
+
+    Uses orjson when installed, which decodes straight from bytes and is
+    several times faster than the stdlib parser on large pipeline files.
+    Files of MMAP_THRESHOLD_BYTES or more are memory-mapped and parsed in
+    place, skipping the copy into a separate bytes object. Decode errors are
+    json.JSONDecodeError in both cases (orjson's error type subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0 or size < MMAP_THRESHOLD_BYTES:
+                return orjson.loads(f.read())
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_json_files(file_paths: Iterable[str], max_workers: int = 8) -> List[Future]:
+    """
+    Parse several JSON files concurrently with load_json_file.
 
     Args:
-        personas_file: Path to personas JSON file
-        validate: Whether to validate each persona (default: False)
-        raise_on_error: If True, raise exceptions. If False, call sys.exit()
+        file_paths: Paths of the files to parse
+        max_workers: Upper bound on reader threads
 
     Returns:
-        List of persona dictionaries
-
-    Raises:
-        InvalidDataFormatError: If file format is invalid
-        DataValidationError: If validation fails
+        One completed Future per path, in the order given; .result() returns
+        the parsed data or re-raises that file's error, so callers keep their
+        own per-file error handling
 
     Example:
-        >>> personas = load_personas('data/personas/personas.json')
-        >>> print(f"Loaded {len(personas)} personas")
+        >>> for path, read in zip(paths, load_json_files(paths)):
+        ...     data = read.result()
+    """
+    file_paths = list(file_paths)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(file_paths)))) as executor:
+        return [executor.submit(load_json_file, path) for path in file_paths]
+
+
+def _fail(error_msg: str, raise_on_error: bool,
+          cause: Optional[BaseException] = None) -> NoReturn:
+    """
+    Log a loader failure, then raise InvalidDataFormatError or exit.
+
+    sys.exit() is only reached when the caller opted out of exceptions with
+    raise_on_error=False.
+    """
+    logger.error(error_msg)
+    if raise_on_error:
+        raise InvalidDataFormatError(error_msg) from cause
+    sys.exit(1)
+
+
+# Context shown in per-item validation warnings for each loader
+def _describe_persona(index: int, persona: Dict[str, Any]) -> str:
+    return f"Persona {index} ({persona.get('id', 'unknown')})"
+
+
+def _describe_record(index: int, record: Dict[str, Any]) -> str:
+    return f"Record {index} ({record.get('id', 'unknown')})"
+
+
+def _describe_pair(index: int, pair: Dict[str, Any]) -> str:
+    persona_id = pair.get('persona', {}).get('id', 'unknown') if isinstance(pair.get('persona'), dict) else 'unknown'
+    return f"Pair {index} (persona {persona_id})"
+
+
+def _load_json_list(file_path: str,
+                    kind: str,
+                    item_label: str,
+                    validation_label: str,
+                    validator: Optional[Callable[..., Tuple[bool, List[str]]]],
+                    describe: Callable[[int, Dict[str, Any]], str],
+                    raise_on_error: bool) -> List[Dict[str, Any]]:
+    """
+    Shared implementation of the JSON list loaders.
+
+    Args:
+        file_path: Path to the JSON file
+        kind: Plural name used in log messages (e.g. "health records")
+        item_label: Prefix for per-item validation errors (e.g. "Record")
+        validation_label: Prefix for the aggregate validation error
+        validator: validate_* function to run on each item, or None to skip
+        describe: Builds the per-item context shown in validation warnings
+        raise_on_error: If True, raise exceptions. If False, call sys.exit()
+
+    Returns:
+        List of item dictionaries
     """
-    logger.info(f"Loading personas from {personas_file}")
+    logger.info(f"Loading {kind} from {file_path}")
+    file_label = kind.capitalize()
 
     try:
         # Check if file exists
-        personas_path = Path(personas_file)
-        if not personas_path.exists():
-            error_msg = f"Personas file not found: {personas_file}"
-            logger.error(error_msg)
-            if raise_on_error:
-                raise InvalidDataFormatError(error_msg)
-            sys.exit(1)
+        if not Path(file_path).exists():
+            _fail(f"{file_label} file not found: {file_path}", raise_on_error)
 
         # Load JSON
-        with open(personas_file, 'r', encoding='utf-8') as f:
-            personas = json.load(f)
+        items = load_json_file(file_path)
 
         # Validate it's a list
-        if not isinstance(personas, list):
-            error_msg = f"Personas file must contain a list, got {type(personas).__name__}"
-            logger.error(error_msg)
-            if raise_on_error:
-                raise InvalidDataFormatError(error_msg)
-            sys.exit(1)
+        if not isinstance(items, list):
+            _fail(f"{file_label} file must contain a list, got {type(items).__name__}", raise_on_error)
 
-        logger.info(f"✅ Loaded {len(personas)} personas")
+        logger.info(f"✅ Loaded {len(items)} {kind}")
 
-        # Validate individual personas if requested
-        if validate:
-            try:
-                from utils.validators import validate_persona
-            except ImportError:
-                from scripts.utils.validators import validate_persona
+        # Nothing to validate
+        if not items:
+            return items
+
+        # Validate individual items if requested
+        if validator is not None:
+            # Only the first few errors make it into the exception message,
+            # so count the rest instead of formatting them
             validation_errors = []
+            error_count = 0
 
-            for i, persona in enumerate(personas):
-                is_valid, warnings = validate_persona(persona, strict=False)
+            for i, item in enumerate(items):
+                is_valid, warnings = validator(item, strict=False)
+                if is_valid and not warnings:
+                    continue
+                details = ', '.join(warnings)
                 if warnings:
-                    logger.warning(f"Persona {i} ({persona.get('id', 'unknown')}): {', '.join(warnings)}")
+                    logger.warning(f"{describe(i, item)}: {details}")
                 if not is_valid:
-                    validation_errors.append(f"Persona {i}: {', '.join(warnings)}")
-
-            if validation_errors and raise_on_error:
-                error_msg = f"Persona validation failed:\n" + "\n".join(validation_errors[:5])
-                if len(validation_errors) > 5:
-                    error_msg += f"\n... and {len(validation_errors) - 5} more errors"
+                    error_count += 1
+                    if len(validation_errors) < 5:
+                        validation_errors.append(f"{item_label} {i}: {details}")
+
+            if error_count and raise_on_error:
+                error_msg = f"{validation_label} validation failed:\n" + "\n".join(validation_errors)
+                if error_count > 5:
+                    error_msg += f"\n... and {error_count - 5} more errors"
                 raise DataValidationError(error_msg)
 
-        return personas
+        return items
 
     except json.JSONDecodeError as e:
-        error_msg = f"Error parsing personas JSON at {personas_file}: {e}"
-        logger.error(error_msg)
-        if raise_on_error:
-            raise InvalidDataFormatError(error_msg) from e
-        sys.exit(1)
+        _fail(f"Error parsing {kind} JSON at {file_path}: {e}", raise_on_error, cause=e)
+    except (InvalidDataFormatError, DataValidationError):
+        raise
     except Exception as e:
-        if isinstance(e, (InvalidDataFormatError, DataValidationError)):
-            raise
-        error_msg = f"Unexpected error loading personas from {personas_file}: {e}"
-        logger.error(error_msg)
-        if raise_on_error:
-            raise InvalidDataFormatError(error_msg) from e
-        sys.exit(1)
+        _fail(f"Unexpected error loading {kind} from {file_path}: {e}", raise_on_error, cause=e)
+
+
+def load_personas(personas_file: str,
+                  validate: bool = False,
+                  raise_on_error: bool = True) -> List[Dict[str, Any]]:
+    """
+    Load and optionally validate personas from JSON file.
+
+    Args:
+        personas_file: Path to personas JSON file
+        validate: Whether to validate each persona (default: False)
+        raise_on_error: If True, raise exceptions. If False, call sys.exit()
+
+    Returns:
+        List of persona dictionaries
+
+    Raises:
+        InvalidDataFormatError: If file format is invalid
+        DataValidationError: If validation fails
+
+    Example:
+        >>> personas = load_personas('data/personas/personas.json')
+        >>> print(f"Loaded {len(personas)} personas")
+    """
+    return _load_json_list(personas_file, 'personas', 'Persona', 'Persona',
+                           validate_persona if validate else None,
+                           _describe_persona, raise_on_error)
 
 
 def load_health_records(records_file: str,
@@ -217,69 +377,9 @@ def load_health_records(records_file: str,
         >>> records = load_health_records('data/health_records/health_records.json')
         >>> print(f"Loaded {len(records)} health records")
     """
-    logger.info(f"Loading health records from {records_file}")
-
-    try:
-        # Check if file exists
-        records_path = Path(records_file)
-        if not records_path.exists():
-            error_msg = f"Health records file not found: {records_file}"
-            logger.error(error_msg)
-            if raise_on_error:
-                raise InvalidDataFormatError(error_msg)
-            sys.exit(1)
-
-        # Load JSON
-        with open(records_file, 'r', encoding='utf-8') as f:
-            records = json.load(f)
-
-        # Validate it's a list
-        if not isinstance(records, list):
-            error_msg = f"Health records file must contain a list, got {type(records).__name__}"
-            logger.error(error_msg)
-            if raise_on_error:
-                raise InvalidDataFormatError(error_msg)
-            sys.exit(1)
-
-        logger.info(f"✅ Loaded {len(records)} health records")
-
-        # Validate individual records if requested
-        if validate:
-            try:
-                from utils.validators import validate_health_record
-            except ImportError:
-                from scripts.utils.validators import validate_health_record
-            validation_errors = []
-
-            for i, record in enumerate(records):
-                is_valid, warnings = validate_health_record(record, strict=False)
-                if warnings:
-                    logger.warning(f"Record {i} ({record.get('id', 'unknown')}): {', '.join(warnings)}")
-                if not is_valid:
-                    validation_errors.append(f"Record {i}: {', '.join(warnings)}")
-
-            if validation_errors and raise_on_error:
-                error_msg = f"Health record validation failed:\n" + "\n".join(validation_errors[:5])
-                if len(validation_errors) > 5:
-                    error_msg += f"\n... and {len(validation_errors) - 5} more errors"
-                raise DataValidationError(error_msg)
-
-        return records
-
-    except json.JSONDecodeError as e:
-        error_msg = f"Error parsing health records JSON at {records_file}: {e}"
-        logger.error(error_msg)
-        if raise_on_error:
-            raise InvalidDataFormatError(error_msg) from e
-        sys.exit(1)
-    except Exception as e:
-        if isinstance(e, (InvalidDataFormatError, DataValidationError)):
-            raise
-        error_msg = f"Unexpected error loading health records from {records_file}: {e}"
-        logger.error(error_msg)
-        if raise_on_error:
-            raise InvalidDataFormatError(error_msg) from e
-        sys.exit(1)
+    return _load_json_list(records_file, 'health records', 'Record', 'Health record',
+                           validate_health_record if validate else None,
+                           _describe_record, raise_on_error)
 
 
 def load_matched_pairs(matched_file: str,
@@ -304,70 +404,55 @@ def load_matched_pairs(matched_file: str,
         >>> pairs = load_matched_pairs('data/matched/matched_personas.json')
         >>> print(f"Loaded {len(pairs)} matched pairs")
     """
-    logger.info(f"Loading matched pairs from {matched_file}")
-
-    try:
-        # Check if file exists
-        matched_path = Path(matched_file)
-        if not matched_path.exists():
-            error_msg = f"Matched pairs file not found: {matched_file}"
-            logger.error(error_msg)
-            if raise_on_error:
-                raise InvalidDataFormatError(error_msg)
-            sys.exit(1)
-
-        # Load JSON
-        with open(matched_file, 'r', encoding='utf-8') as f:
-            pairs = json.load(f)
-
-        # Validate it's a list
-        if not isinstance(pairs, list):
-            error_msg = f"Matched pairs file must contain a list, got {type(pairs).__name__}"
-            logger.error(error_msg)
-            if raise_on_error:
-                raise InvalidDataFormatError(error_msg)
-            sys.exit(1)
+    return _load_json_list(matched_file, 'matched pairs', 'Pair', 'Matched pair',
+                           validate_matched_pair if validate else None,
+                           _describe_pair, raise_on_error)
+
+
+def load_all(personas_file: str,
+             records_file: str,
+             matched_file: Optional[str] = None,
+             validate: bool = False,
+             raise_on_error: bool = True) -> Tuple[List[Dict[str, Any]],
+                                                   List[Dict[str, Any]],
+                                                   Optional[List[Dict[str, Any]]]]:
+    """
+    Load personas, health records and (optionally) matched pairs concurrently.
 
-        logger.info(f"✅ Loaded {len(pairs)} matched pairs")
+    The files are independent, so each loader runs in its own thread and the
+    file reads overlap instead of running back to back.
 
-        # Validate individual pairs if requested
-        if validate:
-            try:
-                from utils.validators import validate_matched_pair
-            except ImportError:
-                from scripts.utils.validators import validate_matched_pair
-            validation_errors = []
+    Args:
+        personas_file: Path to personas JSON file
+        records_file: Path to health records JSON file
+        matched_file: Optional path to matched pairs JSON file
+        validate: Whether to validate each item (default: False)
+        raise_on_error: Passed through to the individual loaders
 
-            for i, pair in enumerate(pairs):
-                is_valid, warnings = validate_matched_pair(pair, strict=False)
-                if warnings:
-                    persona_id = pair.get('persona', {}).get('id', 'unknown') if isinstance(pair.get('persona'), dict) else 'unknown'
-                    logger.warning(f"Pair {i} (persona {persona_id}): {', '.join(warnings)}")
-                if not is_valid:
-                    validation_errors.append(f"Pair {i}: {', '.join(warnings)}")
+    Returns:
+        Tuple of (personas, health_records, matched_pairs); matched_pairs is
+        None when matched_file is not given
 
-            if validation_errors and raise_on_error:
-                error_msg = f"Matched pair validation failed:\n" + "\n".join(validation_errors[:5])
-                if len(validation_errors) > 5:
-                    error_msg += f"\n... and {len(validation_errors) - 5} more errors"
-                raise DataValidationError(error_msg)
+    Raises:
+        InvalidDataFormatError: If any file format is invalid
+        DataValidationError: If validation fails
 
-        return pairs
+    Example:
+        >>> personas, records, _ = load_all('data/personas/personas.json',
+        ...                                 'data/health_records/health_records.json')
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        personas_future = executor.submit(load_personas, personas_file, validate, raise_on_error)
+        records_future = executor.submit(load_health_records, records_file, validate, raise_on_error)
+        pairs_future = None
+        if matched_file is not None:
+            pairs_future = executor.submit(load_matched_pairs, matched_file, validate, raise_on_error)
 
-    except json.JSONDecodeError as e:
-        error_msg = f"Error parsing matched pairs JSON at {matched_file}: {e}"
-        logger.error(error_msg)
-        if raise_on_error:
-            raise InvalidDataFormatError(error_msg) from e
-        sys.exit(1)
-    except Exception as e:
-        if isinstance(e, (InvalidDataFormatError, DataValidationError)):
-            raise
-        error_msg = f"Unexpected error loading matched pairs from {matched_file}: {e}"
-        logger.error(error_msg)
-        if raise_on_error:
-            raise InvalidDataFormatError(error_msg) from e
-        sys.exit(1)
+        return (
+            personas_future.result(),
+            records_future.result(),
+            pairs_future.result() if pairs_future is not None else None
+        )
 
 
 # Export public API
@@ -376,4 +461,7 @@ __all__ = [
     'load_personas',
     'load_health_records',
     'load_matched_pairs',
+    'load_all',
+    'load_json_file',
+    'load_json_files',
 ]
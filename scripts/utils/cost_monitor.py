@@ -13,9 +13,22 @@ Features:
 """
 
 import os
+import re
+import sys
+import glob
 import json
+import time
+import atexit
+import threading
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+# Optional C-backed JSON encoder for the summary file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # ANSI color codes
 class Colors:
@@ -30,6 +43,30 @@ class Colors:
     BG_RED = '\033[41m'
     RESET = '\033[0m'
 
+# Pieces of the threshold alert that do not depend on the event
+_ALERT_BAR = f"{Colors.BG_RED}{Colors.WHITE}{Colors.BOLD}{'!'*70}{Colors.RESET}"
+_ALERT_LINE = f"{Colors.RED}{Colors.BOLD}"
+
+def history_file_for(log_file: str, model: str) -> str:
+    """
+    Path of a model's append-only cost event log next to a summary file.
+
+    e.g. outputs/cost_monitor.json, 'claude-haiku-4-5'
+         -> outputs/cost_monitor_history_claude-haiku-4-5.jsonl
+    """
+    safe_model = re.sub(r'[^A-Za-z0-9._-]+', '_', model)
+    return f"{os.path.splitext(log_file)[0]}_history_{safe_model}.jsonl"
+
+
+def history_files_for(log_file: str) -> List[str]:
+    """
+    All cost event logs belonging to a summary file: the per-model logs and
+    their rotated '.1' copies.
+    """
+    stem = glob.escape(os.path.splitext(log_file)[0])
+    return sorted(glob.glob(f"{stem}_history_*.jsonl") + glob.glob(f"{stem}_history_*.jsonl.1"))
+
+
 class CostMonitor:
     """Monitor and track AI API costs with threshold alerts."""
 
@@ -39,18 +76,45 @@ class CostMonitor:
     # USD to EUR conversion (approximate, update as needed)
     USD_TO_EUR = 0.92
 
-    def __init__(self, log_file: str = 'outputs/cost_monitor.json'):
+    # Cost events are buffered and written to disk once this many are pending
+    # or this many seconds have passed since the last write
+    FLUSH_EVENT_COUNT = 64
+    FLUSH_INTERVAL_SECONDS = 1.0
+
+    def __init__(self, log_file: str = 'outputs/cost_monitor.json',
+                 max_history_events: int = 100_000):
         """
         Initialize cost monitor.
 
         Args:
-            log_file: Path to save cost tracking log
+            log_file: Path to save cost tracking summary. Individual cost
+                      events are appended to one JSON Lines file per model
+                      next to it (see history_file_for).
+            max_history_events: Events kept in a model's log before it is
+                                rotated to '<log>.1' and started afresh. The
+                                previous '.1' is discarded; how many events
+                                that drops is kept in history_events_dropped
         """
+        if max_history_events < 1:
+            raise ValueError(f"max_history_events must be at least 1, got {max_history_events}")
+
         self.log_file = log_file
+        self.max_history_events = max_history_events
         self.model_costs = {}  # {model_name: total_cost_usd}
         self.model_alerts = {}  # {model_name: last_alert_threshold}
-        self.model_tokens = {}  # {model_name: {input: X, output: Y, total: Z}}
-        self.cost_history = []  # List of cost events
+        self.input_tokens = {}  # {model_name: input_tokens}
+        self.output_tokens = {}  # {model_name: output_tokens}
+        self.history_events_dropped = {}  # {model_name: events lost to log rotation}
+        self._cost_history = None  # Read from the history logs on first use
+        self._pending_events = []  # Events not yet written to the history logs
+        self._shard_events = {}  # {history_file: events currently in it}
+        self._lock = threading.RLock()  # Guards state shared by concurrent callers
+        self._last_flush = time.monotonic()
+
+        # Running totals across all models, kept in step with add_cost
+        self._total_usd = 0.0
+        self._total_input_tokens = 0
+        self._total_output_tokens = 0
 
         # Ensure output directory exists
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
@@ -58,45 +122,156 @@ class CostMonitor:
         # Load existing data if available
         self._load_state()
 
+        # Write out any buffered events when the interpreter exits
+        atexit.register(self.flush)
+
     def _load_state(self):
         """Load existing cost tracking state from file."""
+        legacy_history = []
         if os.path.exists(self.log_file):
             try:
                 with open(self.log_file, 'r') as f:
                     data = json.load(f)
                     self.model_costs = data.get('model_costs', {})
                     self.model_alerts = data.get('model_alerts', {})
-                    self.model_tokens = data.get('model_tokens', {})
-                    self.cost_history = data.get('cost_history', [])
+                    model_tokens = data.get('model_tokens', {})
+                    self.input_tokens = {m: t.get('input', 0) for m, t in model_tokens.items()}
+                    self.output_tokens = {m: t.get('output', 0) for m, t in model_tokens.items()}
+                    self.history_events_dropped = data.get('history_events_dropped', {})
+                    legacy_history = data.get('cost_history', [])
             except Exception:
                 pass  # Start fresh if file is corrupted
 
+        self._recompute_totals()
+
+        if legacy_history and not history_files_for(self.log_file):
+            # Summary written before events moved to the JSONL logs: migrate,
+            # then rewrite the summary without them
+            self._append_events(legacy_history)
+            self._save_state()
+
+    @property
+    def cost_history(self) -> List[Dict]:
+        """
+        All recorded cost events in time order.
+
+        The history logs are only read the first time this is accessed, so
+        tracking costs never pays for the size of the history. Returns a
+        snapshot; every event carries its ISO 'timestamp', including ones
+        not yet flushed.
+        """
+        with self._lock:
+            self._render_timestamps()
+            if self._cost_history is None:
+                self._cost_history = load_cost_history(self.log_file) + self._pending_events
+            return list(self._cost_history)
+
+    def _render_timestamps(self):
+        """Replace the raw clock reading of buffered events with an ISO 'timestamp'."""
+        for event in self._pending_events:
+            if 'ts_ns' in event:
+                event['timestamp'] = datetime.fromtimestamp(event.pop('ts_ns') / 1e9).isoformat()
+
+    def _append_events(self, events: List[Dict]):
+        """
+        Append events to their models' history logs.
+
+        A log is rotated as soon as it holds max_history_events, so no log
+        ever grows past the limit, however large the batch.
+        """
+        by_model = {}
+        for event in events:
+            by_model.setdefault(event.get('model', 'unknown'), []).append(event)
+
+        for model, model_events in by_model.items():
+            history_file = history_file_for(self.log_file, model)
+            count = self._shard_events.get(history_file)
+            if count is None:
+                count = _count_lines(history_file)
+
+            written = 0
+            while written < len(model_events):
+                if count >= self.max_history_events:
+                    self._rotate_log(model, history_file)
+                    count = 0
+                chunk = model_events[written:written + self.max_history_events - count]
+                with open(history_file, 'a') as f:
+                    f.write(''.join(json.dumps(event) + '\n' for event in chunk))
+                count += len(chunk)
+                written += len(chunk)
+            self._shard_events[history_file] = count
+
+    def _rotate_log(self, model: str, history_file: str):
+        """Move a full log to '<log>.1', counting the events that discards."""
+        rotated_file = history_file + '.1'
+        dropped = _count_lines(rotated_file)
+        if dropped:
+            self.history_events_dropped[model] = self.history_events_dropped.get(model, 0) + dropped
+        os.replace(history_file, rotated_file)
+
+    def _recompute_totals(self):
+        """Rebuild the running totals from the per-model state."""
+        self._total_usd = sum(self.model_costs.values())
+        self._total_input_tokens = sum(self.input_tokens.values())
+        self._total_output_tokens = sum(self.output_tokens.values())
+
+    def flush(self):
+        """Write buffered cost events to the history log and save the summary."""
+        with self._lock:
+            if self._pending_events:
+                self._render_timestamps()
+                self._append_events(self._pending_events)
+                self._pending_events = []
+                self._save_state()
+            self._last_flush = time.monotonic()
+
     def _save_state(self):
-        """Save cost tracking state to file."""
-        # Calculate total tokens across all models
-        total_input = sum(tokens.get('input', 0) for tokens in self.model_tokens.values())
-        total_output = sum(tokens.get('output', 0) for tokens in self.model_tokens.values())
+        """
+        Save cost tracking summary to file.
+
+        Only aggregates are rewritten here; cost events are appended to
+        the history log as they happen, so each save is independent of how
+        many calls have been recorded.
+        """
+        total_input = self._total_input_tokens
+        total_output = self._total_output_tokens
+
+        # Nested per-model token form, as read by the cost dashboard
+        model_tokens = {}
+        for model in self.model_costs:
+            inp = self.input_tokens.get(model, 0)
+            out = self.output_tokens.get(model, 0)
+            model_tokens[model] = {'input': inp, 'output': out, 'total': inp + out}
 
         data = {
             'timestamp': datetime.now().isoformat(),
             'model_costs': self.model_costs,
             'model_alerts': self.model_alerts,
-            'model_tokens': self.model_tokens,
-            'cost_history': self.cost_history,
-            'total_cost_usd': sum(self.model_costs.values()),
-            'total_cost_eur': sum(self.model_costs.values()) * self.USD_TO_EUR,
+            'model_tokens': model_tokens,
+            'history_events_dropped': self.history_events_dropped,
+            'total_cost_usd': self._total_usd,
+            'total_cost_eur': self._total_usd * self.USD_TO_EUR,
             'total_input_tokens': total_input,
             'total_output_tokens': total_output,
             'total_tokens': total_input + total_output
         }
 
-        with open(self.log_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Same two-space layout either way; orjson just does the encoding in C
+        if ORJSON_AVAILABLE:
+            with open(self.log_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.log_file, 'w') as f:
+                json.dump(data, f, indent=2)
 
     def add_cost(self, model: str, cost_usd: float, metadata: Optional[Dict] = None):
         """
         Add cost for a model and check if alert threshold crossed.
 
+        The event is buffered and written on the next flush (see
+        FLUSH_EVENT_COUNT / FLUSH_INTERVAL_SECONDS, threshold alerts, and
+        interpreter exit); call flush() to force it to disk.
+
         Args:
             model: Model identifier (e.g., 'claude-haiku-4-5')
             cost_usd: Cost in USD
@@ -106,77 +281,86 @@ class CostMonitor:
         Returns:
             bool: True if alert threshold was crossed
         """
-        # Initialize model if not seen before
-        if model not in self.model_costs:
-            self.model_costs[model] = 0.0
-            self.model_alerts[model] = 0
-            self.model_tokens[model] = {'input': 0, 'output': 0, 'total': 0}
-
-        # Add cost
-        old_cost = self.model_costs[model]
-        self.model_costs[model] += cost_usd
-        new_cost = self.model_costs[model]
-
-        # Track token usage from metadata
-        if metadata:
-            input_tokens = metadata.get('input_tokens', 0)
-            output_tokens = metadata.get('output_tokens', 0)
-
-            self.model_tokens[model]['input'] += input_tokens
-            self.model_tokens[model]['output'] += output_tokens
-            self.model_tokens[model]['total'] += input_tokens + output_tokens
-
-        # Convert to EUR
-        old_cost_eur = old_cost * self.USD_TO_EUR
-        new_cost_eur = new_cost * self.USD_TO_EUR
-
-        # Log event (include token counts if available)
-        event = {
-            'timestamp': datetime.now().isoformat(),
-            'model': model,
-            'cost_usd': cost_usd,
-            'cost_eur': cost_usd * self.USD_TO_EUR,
-            'cumulative_usd': new_cost,
-            'cumulative_eur': new_cost_eur,
-            'metadata': metadata or {}
-        }
-
-        # Add token counts to event if available
-        if metadata:
-            event['input_tokens'] = metadata.get('input_tokens', 0)
-            event['output_tokens'] = metadata.get('output_tokens', 0)
-            event['total_tokens'] = event['input_tokens'] + event['output_tokens']
-
-        self.cost_history.append(event)
-
-        # Check if we crossed a threshold
-        old_threshold = int(old_cost_eur / self.ALERT_THRESHOLD_EUR)
-        new_threshold = int(new_cost_eur / self.ALERT_THRESHOLD_EUR)
-
-        alert_triggered = False
-        if new_threshold > old_threshold:
-            # Crossed a €5 threshold!
-            threshold_amount = new_threshold * self.ALERT_THRESHOLD_EUR
-            self._display_alert(model, new_cost_eur, threshold_amount)
-            self.model_alerts[model] = new_threshold
-            alert_triggered = True
-
-        # Save state
-        self._save_state()
-
-        return alert_triggered
+        with self._lock:
+            # Initialize model if not seen before
+            if model not in self.model_costs:
+                self.model_costs[model] = 0.0
+                self.model_alerts[model] = 0
+
+            # Add cost
+            old_cost = self.model_costs[model]
+            self.model_costs[model] += cost_usd
+            new_cost = self.model_costs[model]
+            self._total_usd += cost_usd
+
+            # Convert to EUR
+            old_cost_eur = old_cost * self.USD_TO_EUR
+            new_cost_eur = new_cost * self.USD_TO_EUR
+
+            # Log event
+            # Raw clock reading; rendered to an ISO 'timestamp' when flushed or
+            # read back through cost_history
+            event = {
+                'ts_ns': time.time_ns(),
+                'model': model,
+                'cost_usd': cost_usd,
+                'cost_eur': cost_usd * self.USD_TO_EUR,
+                'cumulative_usd': new_cost,
+                'cumulative_eur': new_cost_eur,
+                'metadata': metadata or {}
+            }
+
+            # Track token usage from metadata and add the counts to the event;
+            # calls without metadata skip this entirely
+            if metadata:
+                input_tokens = metadata.get('input_tokens', 0)
+                output_tokens = metadata.get('output_tokens', 0)
+
+                self.input_tokens[model] = self.input_tokens.get(model, 0) + input_tokens
+                self.output_tokens[model] = self.output_tokens.get(model, 0) + output_tokens
+                self._total_input_tokens += input_tokens
+                self._total_output_tokens += output_tokens
+
+                event['input_tokens'] = input_tokens
+                event['output_tokens'] = output_tokens
+                event['total_tokens'] = input_tokens + output_tokens
+
+            if self._cost_history is not None:
+                self._cost_history.append(event)
+            self._pending_events.append(event)
+
+            # Check if we crossed a threshold
+            old_threshold = int(old_cost_eur / self.ALERT_THRESHOLD_EUR)
+            new_threshold = int(new_cost_eur / self.ALERT_THRESHOLD_EUR)
+
+            alert_triggered = False
+            if new_threshold > old_threshold:
+                # Crossed a €5 threshold!
+                threshold_amount = new_threshold * self.ALERT_THRESHOLD_EUR
+                self._display_alert(model, new_cost_eur, threshold_amount)
+                self.model_alerts[model] = new_threshold
+                alert_triggered = True
+
+            # Save state; alerts are written through immediately
+            if (alert_triggered
+                    or len(self._pending_events) >= self.FLUSH_EVENT_COUNT
+                    or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SECONDS):
+                self.flush()
+
+            return alert_triggered
 
     def _display_alert(self, model: str, cumulative_eur: float, threshold: float):
         """Display RED terminal alert."""
 
-        # Create dramatic alert
-        alert_bar = f"{Colors.BG_RED}{Colors.WHITE}{Colors.BOLD}{'!'*70}{Colors.RESET}"
-
-        print(f"\n{alert_bar}")
-        print(f"{Colors.RED}{Colors.BOLD}🚨 COST ALERT: €{threshold:.0f} THRESHOLD CROSSED 🚨{Colors.RESET}")
-        print(f"{Colors.RED}{Colors.BOLD}Model: {model}{Colors.RESET}")
-        print(f"{Colors.RED}{Colors.BOLD}Cumulative Cost: €{cumulative_eur:.2f}{Colors.RESET}")
-        print(f"{alert_bar}\n")
+        # Create dramatic alert, written in one go
+        sys.stdout.write(
+            f"\n{_ALERT_BAR}\n"
+            f"{_ALERT_LINE}🚨 COST ALERT: €{threshold:.0f} THRESHOLD CROSSED 🚨{Colors.RESET}\n"
+            f"{_ALERT_LINE}Model: {model}{Colors.RESET}\n"
+            f"{_ALERT_LINE}Cumulative Cost: €{cumulative_eur:.2f}{Colors.RESET}\n"
+            f"{_ALERT_BAR}\n\n"
+        )
+        sys.stdout.flush()
 
     def display_status(self, model: Optional[str] = None):
         """
@@ -188,11 +372,12 @@ class CostMonitor:
         if model and model in self.model_costs:
             cost_usd = self.model_costs[model]
             cost_eur = cost_usd * self.USD_TO_EUR
-            tokens = self.model_tokens.get(model, {'input': 0, 'output': 0, 'total': 0})
+            inp = self.input_tokens.get(model, 0)
+            out = self.output_tokens.get(model, 0)
 
             print(f"\n{Colors.CYAN}Cost Status for {model}:{Colors.RESET}")
             print(f"  ${cost_usd:.4f} USD / €{cost_eur:.4f} EUR")
-            print(f"  {Colors.WHITE}Tokens: {tokens['input']:,} input + {tokens['output']:,} output = {tokens['total']:,} total{Colors.RESET}")
+            print(f"  {Colors.WHITE}Tokens: {inp:,} input + {out:,} output = {inp + out:,} total{Colors.RESET}")
 
             # Show progress to next threshold
             next_threshold = (int(cost_eur / self.ALERT_THRESHOLD_EUR) + 1) * self.ALERT_THRESHOLD_EUR
@@ -206,24 +391,24 @@ class CostMonitor:
             print(f"{Colors.CYAN}{Colors.BOLD}  Cost Monitoring Status{Colors.RESET}")
             print(f"{Colors.CYAN}{'='*70}{Colors.RESET}\n")
 
-            total_usd = sum(self.model_costs.values())
+            total_usd = self._total_usd
             total_eur = total_usd * self.USD_TO_EUR
 
-            # Calculate total tokens
-            total_input = sum(tokens.get('input', 0) for tokens in self.model_tokens.values())
-            total_output = sum(tokens.get('output', 0) for tokens in self.model_tokens.values())
+            total_input = self._total_input_tokens
+            total_output = self._total_output_tokens
             total_tokens = total_input + total_output
 
             for model_name, cost_usd in sorted(self.model_costs.items()):
                 cost_eur = cost_usd * self.USD_TO_EUR
                 alerts = self.model_alerts.get(model_name, 0)
-                tokens = self.model_tokens.get(model_name, {'input': 0, 'output': 0, 'total': 0})
+                inp = self.input_tokens.get(model_name, 0)
+                out = self.output_tokens.get(model_name, 0)
 
                 alert_str = f" ({alerts} alerts)" if alerts > 0 else ""
 
                 print(f"{Colors.WHITE}{model_name}:{Colors.RESET}")
                 print(f"  ${cost_usd:.4f} USD / €{cost_eur:.4f} EUR{Colors.RED}{alert_str}{Colors.RESET}")
-                print(f"  Tokens: {tokens['input']:,} in / {tokens['output']:,} out / {tokens['total']:,} total")
+                print(f"  Tokens: {inp:,} in / {out:,} out / {inp + out:,} total")
 
             print(f"\n{Colors.BOLD}Total Cost: ${total_usd:.4f} USD / €{total_eur:.4f} EUR{Colors.RESET}")
             print(f"{Colors.BOLD}Total Tokens: {total_input:,} in / {total_output:,} out / {total_tokens:,} total{Colors.RESET}")
@@ -239,7 +424,7 @@ class CostMonitor:
         Returns:
             Total cost
         """
-        total_usd = sum(self.model_costs.values())
+        total_usd = self._total_usd
         return total_usd * self.USD_TO_EUR if in_eur else total_usd
 
     def get_model_cost(self, model: str, in_eur: bool = True) -> float:
@@ -256,25 +441,78 @@ class CostMonitor:
         cost_usd = self.model_costs.get(model, 0.0)
         return cost_usd * self.USD_TO_EUR if in_eur else cost_usd
 
+    def get_costs_by_model(self, in_eur: bool = True) -> Dict[str, float]:
+        """
+        Get costs for all models in one pass.
+
+        Args:
+            in_eur: If True, return EUR. Otherwise USD.
+
+        Returns:
+            Dictionary mapping model identifier to cost
+        """
+        rate = self.USD_TO_EUR if in_eur else 1.0
+        return {model: cost_usd * rate for model, cost_usd in self.model_costs.items()}
+
     def reset(self):
         """Reset all cost tracking."""
         self.model_costs = {}
         self.model_alerts = {}
-        self.model_tokens = {}
-        self.cost_history = []
+        self.input_tokens = {}
+        self.output_tokens = {}
+        self.history_events_dropped = {}
+        self._cost_history = []
+        self._pending_events = []
+        self._recompute_totals()
+        for history_file in history_files_for(self.log_file):
+            os.remove(history_file)
+        self._shard_events = {}
         self._save_state()
 
         print(f"{Colors.YELLOW}Cost monitor reset{Colors.RESET}")
 
 
+def load_cost_history(log_file: str) -> List[Dict]:
+    """
+    Read the cost events recorded alongside a summary file, in time order.
+
+    Merges every history log (see history_files_for). Blank or truncated
+    lines (e.g. from an interrupted write) are skipped.
+    """
+    events = []
+    for history_file in history_files_for(log_file):
+        with open(history_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    events.sort(key=lambda event: event.get('timestamp', ''))
+    return events
+
+
+def _count_lines(path: str) -> int:
+    """Number of lines in a file, or 0 if it does not exist."""
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f)
+
+
 # Global instance for easy access
 _global_monitor = None
+_monitor_lock = threading.Lock()
 
 def get_monitor() -> CostMonitor:
-    """Get global cost monitor instance."""
+    """Get global cost monitor instance (safe to call from several threads)."""
     global _global_monitor
     if _global_monitor is None:
-        _global_monitor = CostMonitor()
+        with _monitor_lock:
+            if _global_monitor is None:
+                _global_monitor = CostMonitor()
     return _global_monitor
 
 
@@ -13,7 +13,6 @@ Usage:
         --output data/interviews_export.csv
 """
 
-import json
 import csv
 import argparse
 import glob
@@ -21,6 +20,11 @@ from pathlib import Path
 from typing import List, Dict, Any
 import sys
 
+# Run as a standalone script from scripts/utils/; make the utils package importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.common_loaders import load_json_files
+
 
 def load_interviews(input_dir: str) -> List[Dict[str, Any]]:
     """Load all interview JSON files from directory."""
@@ -31,13 +35,14 @@ def load_interviews(input_dir: str) -> List[Dict[str, Any]]:
 
     print(f"Found {len(interview_files)} interview files")
 
+    interview_files = sorted(interview_files)
+
     interviews = []
-    for filepath in sorted(interview_files):
+    for filepath, read in zip(interview_files, load_json_files(interview_files)):
         try:
-            with open(filepath, 'r') as f:
-                interview = json.load(f)
-                interview['_source_file'] = Path(filepath).name
-                interviews.append(interview)
+            interview = read.result()
+            interview['_source_file'] = Path(filepath).name
+            interviews.append(interview)
         except Exception as e:
             print(f"Warning: Failed to load {filepath}: {e}")
 
@@ -5,7 +5,7 @@ This module provides validation for all data inputs to ensure data quality
 and prevent errors downstream.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import logging
 
 # Handle both direct and package imports
@@ -30,6 +30,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Lookup tables used by the per-record validators. Built once at import so
+# validating a large file does not rebuild them for every record.
+_PERSONA_REQUIRED_FIELDS = ('age', 'gender', 'description')
+_HEALTH_RECORD_REQUIRED_FIELDS = ('id',)
+_MATCHED_PAIR_REQUIRED_FIELDS = ('persona', 'health_record', 'compatibility_score')
+_VALID_GENDERS = frozenset(['female', 'f'])
+_VALID_EDUCATION = frozenset(['no_degree', 'high_school', 'bachelors', 'masters',
+                              'doctorate', 'unknown', 'college', 'graduate'])
+_VALID_INCOME = frozenset(['low', 'lower_middle', 'middle', 'upper_middle',
+                           'high', 'unknown'])
+_HEALTH_RECORD_LIST_FIELDS = ('conditions', 'medications', 'allergies')
+
 
 # Age Validation
 def validate_age(age: Any, min_age: int = 12, max_age: int = 60, field_name: str = "age") -> int:
@@ -124,14 +136,14 @@ def validate_compatibility_score(score: Any, field_name: str = "compatibility_sc
     return score_float
 
 
-def validate_required_fields(data: Dict[str, Any], required_fields: List[str],
+def validate_required_fields(data: Dict[str, Any], required_fields: Sequence[str],
                             data_type: str = "data") -> None:
     """
     Validate that all required fields are present in data.
 
     Args:
         data: Dictionary to validate
-        required_fields: List of required field names
+        required_fields: Sequence of required field names
         data_type: Type of data for error messages
 
     Raises:
@@ -181,7 +193,7 @@ def validate_persona(persona: Dict[str, Any], strict: bool = False) -> Tuple[boo
 
     try:
         # Check required fields
-        required_fields = ['age', 'gender', 'description']
+        required_fields = _PERSONA_REQUIRED_FIELDS
         if strict:
             validate_required_fields(persona, required_fields, "persona")
         else:
@@ -202,7 +214,7 @@ def validate_persona(persona: Dict[str, Any], strict: bool = False) -> Tuple[boo
 
         # Validate gender if present
         if 'gender' in persona and persona['gender']:
-            if persona['gender'].lower() not in ['female', 'f']:
+            if persona['gender'].lower() not in _VALID_GENDERS:
                 msg = f"Gender is '{persona['gender']}', expected 'female' for pregnancy study"
                 if strict:
                     raise DataValidationError(msg)
@@ -220,17 +232,13 @@ def validate_persona(persona: Dict[str, Any], strict: bool = False) -> Tuple[boo
 
         # Validate education if present
         if 'education' in persona and persona['education']:
-            valid_education = ['no_degree', 'high_school', 'bachelors', 'masters',
-                             'doctorate', 'unknown', 'college', 'graduate']
-            if persona['education'].lower() not in valid_education:
+            if persona['education'].lower() not in _VALID_EDUCATION:
                 msg = f"Unknown education level: {persona['education']}"
                 warnings.append(msg)
 
         # Validate income level if present
         if 'income_level' in persona and persona['income_level']:
-            valid_income = ['low', 'lower_middle', 'middle', 'upper_middle',
-                          'high', 'unknown']
-            if persona['income_level'].lower() not in valid_income:
+            if persona['income_level'].lower() not in _VALID_INCOME:
                 msg = f"Unknown income level: {persona['income_level']}"
                 warnings.append(msg)
 
@@ -262,7 +270,7 @@ def validate_health_record(record: Dict[str, Any], strict: bool = False) -> Tupl
 
     try:
         # Check required fields
-        required_fields = ['id']
+        required_fields = _HEALTH_RECORD_REQUIRED_FIELDS
         if strict:
             validate_required_fields(record, required_fields, "health_record")
         else:
@@ -292,20 +300,14 @@ def validate_health_record(record: Dict[str, Any], strict: bool = False) -> Tupl
                 is_valid = False
 
         # Validate data types for common fields
-        type_checks = {
-            'conditions': list,
-            'medications': list,
-            'allergies': list
-        }
-
-        for field, expected_type in type_checks.items():
-            if field in record and record[field] is not None:
-                if not isinstance(record[field], expected_type):
-                    msg = f"Field '{field}' should be {expected_type.__name__}, got {type(record[field]).__name__}"
-                    if strict:
-                        raise InvalidTypeError(field, expected_type.__name__, type(record[field]).__name__)
-                    warnings.append(msg)
-                    is_valid = False
+        for field in _HEALTH_RECORD_LIST_FIELDS:
+            value = record.get(field)
+            if value is not None and not isinstance(value, list):
+                msg = f"Field '{field}' should be list, got {type(value).__name__}"
+                if strict:
+                    raise InvalidTypeError(field, 'list', type(value).__name__)
+                warnings.append(msg)
+                is_valid = False
 
     except Exception as e:
         if strict:
@@ -335,7 +337,7 @@ def validate_matched_pair(pair: Dict[str, Any], strict: bool = False) -> Tuple[b
 
     try:
         # Check required fields
-        required_fields = ['persona', 'health_record', 'compatibility_score']
+        required_fields = _MATCHED_PAIR_REQUIRED_FIELDS
         if strict:
             validate_required_fields(pair, required_fields, "matched_pair")
         else:
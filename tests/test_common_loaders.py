@@ -8,11 +8,14 @@ import pytest
 import json
 import yaml
 from pathlib import Path
+from scripts.utils import common_loaders
 from scripts.utils.common_loaders import (
     load_config,
     load_personas,
     load_health_records,
-    load_matched_pairs
+    load_matched_pairs,
+    load_all,
+    load_json_files
 )
 
 
@@ -48,6 +51,24 @@ class TestLoadConfig:
         # Should return empty dict on YAML error
         assert config == {}
 
+    def test_load_config_returns_independent_copies(self, temp_config_file):
+        """Test that mutating a loaded config does not leak into later loads."""
+        first = load_config(str(temp_config_file))
+        first['retry']['max_retries'] = 99
+
+        second = load_config(str(temp_config_file))
+        assert second['retry']['max_retries'] == 3
+
+    def test_load_config_picks_up_file_changes(self, tmp_path, sample_config):
+        """Test that an edited config file is re-parsed."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump(sample_config))
+        assert load_config(str(config_file))['active_provider'] == 'anthropic'
+
+        sample_config['active_provider'] = 'openai'
+        config_file.write_text(yaml.dump(sample_config) + "\n# edited\n")
+        assert load_config(str(config_file))['active_provider'] == 'openai'
+
     def test_load_config_with_retry_section(self, temp_config_file):
         """Test that config includes retry configuration."""
         config = load_config(str(temp_config_file))
@@ -99,6 +120,45 @@ class TestLoadPersonas:
         personas = load_personas(str(empty_list))
         assert personas == []
 
+    def test_load_empty_personas_list_with_validation(self, tmp_path):
+        """Test that validating an empty personas list succeeds."""
+        empty_list = tmp_path / "empty_list.json"
+        empty_list.write_text('[]')
+
+        assert load_personas(str(empty_list), validate=True) == []
+
+    def test_validation_error_lists_first_five(self, tmp_path):
+        """Test that the validation error shows five items and counts the rest."""
+        personas_file = tmp_path / "invalid_personas.json"
+        personas_file.write_text(json.dumps([{'id': f'p{i}'} for i in range(8)]))
+
+        with pytest.raises(Exception, match="Persona validation failed") as exc_info:
+            load_personas(str(personas_file), validate=True)
+
+        message = str(exc_info.value)
+        assert "Persona 4:" in message
+        assert "Persona 5:" not in message
+        assert message.endswith("... and 3 more errors")
+
+    def test_load_personas_stdlib_fallback(self, temp_personas_file, monkeypatch):
+        """Test that the stdlib parser gives the same result as orjson."""
+        fast = load_personas(str(temp_personas_file))
+
+        monkeypatch.setattr(common_loaders, 'ORJSON_AVAILABLE', False)
+        fallback = load_personas(str(temp_personas_file))
+
+        assert fallback == fast
+
+    @pytest.mark.skipif(not common_loaders.ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_load_personas_memory_mapped(self, temp_personas_file, monkeypatch):
+        """Test that files above the mmap threshold load identically."""
+        expected = load_personas(str(temp_personas_file))
+
+        monkeypatch.setattr(common_loaders, 'MMAP_THRESHOLD_BYTES', 0)
+        personas = load_personas(str(temp_personas_file))
+
+        assert personas == expected
+
 
 @pytest.mark.loaders
 @pytest.mark.unit
@@ -201,3 +261,41 @@ class TestLoadersIntegration:
         assert len(personas) == 3
         assert len(records) == 3
         assert config['active_provider'] == 'anthropic'
+
+    def test_load_all_concurrently(self, tmp_path, sample_personas, sample_health_records,
+                                   sample_matched_pair):
+        """Test loading personas, records and pairs in one concurrent call."""
+        personas_file = tmp_path / "personas.json"
+        personas_file.write_text(json.dumps(sample_personas))
+        records_file = tmp_path / "records.json"
+        records_file.write_text(json.dumps(sample_health_records))
+        matched_file = tmp_path / "matched.json"
+        matched_file.write_text(json.dumps([sample_matched_pair]))
+
+        personas, records, pairs = load_all(str(personas_file), str(records_file), str(matched_file))
+        assert personas == sample_personas
+        assert records == sample_health_records
+        assert len(pairs) == 1
+
+        _, _, no_pairs = load_all(str(personas_file), str(records_file))
+        assert no_pairs is None
+
+    def test_load_json_files_keeps_order_and_errors(self, tmp_path):
+        """Test that each file's result or error comes back in input order."""
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"doc_{i}.json"
+            path.write_text(json.dumps({'index': i}))
+            paths.append(str(path))
+        bad = tmp_path / "bad.json"
+        bad.write_text('{broken')
+        paths.insert(2, str(bad))
+
+        reads = load_json_files(paths)
+
+        assert len(reads) == len(paths)
+        with pytest.raises(json.JSONDecodeError):
+            reads[2].result()
+        loaded = [read.result()['index'] for i, read in enumerate(reads) if i != 2]
+        assert loaded == [0, 1, 2, 3, 4]
+        assert load_json_files([]) == []
@@ -0,0 +1,155 @@
+"""
+Tests for scripts/utils/cost_monitor.py
+
+Tests cost tracking, the per-model JSON Lines history logs and their
+rotation, and migration of summaries that still embed cost_history.
+"""
+
+import pytest
+import json
+from pathlib import Path
+from scripts.utils.cost_monitor import (
+    CostMonitor,
+    history_file_for,
+    history_files_for,
+    load_cost_history
+)
+
+
+@pytest.fixture
+def cost_file(tmp_path) -> str:
+    """Path of a cost monitor summary inside a fresh directory."""
+    return str(tmp_path / "outputs" / "cost_monitor.json")
+
+
+def _line_count(path: str) -> int:
+    with open(path) as f:
+        return sum(1 for _ in f)
+
+
+@pytest.mark.cost
+@pytest.mark.unit
+class TestCostMonitorPersistence:
+    """Tests for saving and reloading cost monitor state."""
+
+    def test_reload_restores_totals_tokens_and_history(self, cost_file):
+        """Test that a new monitor picks up exactly what was flushed."""
+        monitor = CostMonitor(cost_file)
+        monitor.add_cost('claude-haiku-4-5', 0.25, {'input_tokens': 1000, 'output_tokens': 200})
+        monitor.add_cost('gpt-4o', 0.50, {'input_tokens': 3000, 'output_tokens': 400})
+        monitor.add_cost('claude-haiku-4-5', 0.10)
+        monitor.flush()
+
+        reloaded = CostMonitor(cost_file)
+
+        assert reloaded.model_costs == monitor.model_costs
+        assert reloaded.input_tokens == {'claude-haiku-4-5': 1000, 'gpt-4o': 3000}
+        assert reloaded.output_tokens == {'claude-haiku-4-5': 200, 'gpt-4o': 400}
+        assert reloaded.get_total_cost(in_eur=False) == pytest.approx(0.85)
+        assert reloaded.cost_history == monitor.cost_history
+        assert len(reloaded.cost_history) == 3
+
+    def test_events_are_buffered_until_flush(self, cost_file, monkeypatch):
+        """Test that events reach the history log only when flushed."""
+        monkeypatch.setattr(CostMonitor, 'FLUSH_INTERVAL_SECONDS', 3600.0)
+        monitor = CostMonitor(cost_file)
+        monitor.add_cost('claude-haiku-4-5', 0.01)
+
+        assert history_files_for(cost_file) == []
+
+        monitor.flush()
+        assert load_cost_history(cost_file)[0]['cost_usd'] == 0.01
+
+    def test_buffered_events_have_timestamps(self, cost_file, monkeypatch):
+        """Test that unflushed events read back the same shape as flushed ones."""
+        monkeypatch.setattr(CostMonitor, 'FLUSH_INTERVAL_SECONDS', 3600.0)
+        monitor = CostMonitor(cost_file)
+        monitor.add_cost('claude-haiku-4-5', 0.01)
+
+        event = monitor.cost_history[0]
+        assert 'timestamp' in event
+        assert 'ts_ns' not in event
+
+    def test_embedded_history_is_migrated_once(self, cost_file):
+        """Test that a summary with embedded cost_history is moved to the logs once."""
+        events = [
+            {'timestamp': '2025-11-01T10:00:00', 'model': 'claude-haiku-4-5', 'cost_usd': 0.2},
+            {'timestamp': '2025-11-01T10:05:00', 'model': 'gpt-4o', 'cost_usd': 0.3},
+        ]
+        Path(cost_file).parent.mkdir(parents=True)
+        Path(cost_file).write_text(json.dumps({
+            'model_costs': {'claude-haiku-4-5': 0.2, 'gpt-4o': 0.3},
+            'cost_history': events,
+        }))
+
+        monitor = CostMonitor(cost_file)
+        assert monitor.cost_history == events
+        assert 'cost_history' not in json.loads(Path(cost_file).read_text())
+
+        CostMonitor(cost_file)
+        assert load_cost_history(cost_file) == events
+        assert _line_count(history_file_for(cost_file, 'gpt-4o')) == 1
+
+    def test_reset_removes_history_logs(self, cost_file):
+        """Test that reset clears totals and deletes every history log."""
+        monitor = CostMonitor(cost_file, max_history_events=2)
+        for _ in range(5):
+            monitor.add_cost('claude-haiku-4-5', 0.01)
+        monitor.flush()
+        assert history_files_for(cost_file)
+
+        monitor.reset()
+
+        assert history_files_for(cost_file) == []
+        assert monitor.cost_history == []
+        assert CostMonitor(cost_file).get_total_cost() == 0
+
+
+@pytest.mark.cost
+@pytest.mark.unit
+class TestHistoryRotation:
+    """Tests for per-model history log rotation."""
+
+    def test_rotation_accounts_for_every_event(self, cost_file):
+        """Test that kept plus dropped events add up to everything recorded."""
+        monitor = CostMonitor(cost_file, max_history_events=3)
+        for _ in range(13):
+            monitor.add_cost('claude-haiku-4-5', 0.01)
+        monitor.flush()
+
+        log = history_file_for(cost_file, 'claude-haiku-4-5')
+        kept = load_cost_history(cost_file)
+        dropped = json.loads(Path(cost_file).read_text())['history_events_dropped']
+
+        assert _line_count(log) <= 3
+        assert _line_count(log + '.1') == 3
+        assert len(kept) + dropped['claude-haiku-4-5'] == 13
+        assert kept[-1]['cumulative_usd'] == pytest.approx(0.13)
+
+    def test_first_batch_larger_than_limit_is_rotated(self, cost_file, monkeypatch):
+        """Test that a single flush never leaves a log above the limit."""
+        monkeypatch.setattr(CostMonitor, 'FLUSH_INTERVAL_SECONDS', 3600.0)
+        monitor = CostMonitor(cost_file, max_history_events=3)
+        for _ in range(5):
+            monitor.add_cost('claude-haiku-4-5', 0.01)
+        monitor.flush()
+
+        log = history_file_for(cost_file, 'claude-haiku-4-5')
+        assert _line_count(log) == 2
+        assert _line_count(log + '.1') == 3
+
+    def test_logs_are_sharded_by_model(self, cost_file):
+        """Test that each model writes to its own log."""
+        monitor = CostMonitor(cost_file)
+        monitor.add_cost('claude-haiku-4-5', 0.01)
+        monitor.add_cost('openai/gpt-4o', 0.02)
+        monitor.flush()
+
+        assert _line_count(history_file_for(cost_file, 'claude-haiku-4-5')) == 1
+        assert _line_count(history_file_for(cost_file, 'openai/gpt-4o')) == 1
+        assert len(history_files_for(cost_file)) == 2
+
+    def test_invalid_history_limit(self, cost_file):
+        """Test that a history limit below one is rejected."""
+        with pytest.raises(ValueError):
+            CostMonitor(cost_file, max_history_events=0)